@@ -57,16 +57,22 @@ class GaussianNoise(ProcessingComponent):
         wavelength = self.global_settings[Tags.WAVELENGTH]
         data_array = load_data_field(self.global_settings[Tags.SIMPA_OUTPUT_PATH], data_field, wavelength)
 
+        # The noise is applied in place of the sampled noise array, which avoids allocating another array of the
+        # size of the data field
         if mode == Tags.NOISE_MODE_ADDITIVE:
-            data_array = data_array + np.random.normal(mean, std, size=np.shape(data_array))
+            noise = np.random.normal(mean, std, size=np.shape(data_array))
+            noise += data_array
+            data_array = noise
         elif mode == Tags.NOISE_MODE_MULTIPLICATIVE:
-            data_array = data_array * np.random.normal(mean, std, size=np.shape(data_array))
+            noise = np.random.normal(mean, std, size=np.shape(data_array))
+            noise *= data_array
+            data_array = noise
 
         if not (Tags.IGNORE_QA_ASSERTIONS in self.global_settings and Tags.IGNORE_QA_ASSERTIONS):
             assert_array_well_defined(data_array)
 
         if non_negative:
-            data_array[data_array < EPS] = EPS
+            np.maximum(data_array, EPS, out=data_array)
         save_data_field(data_array, self.global_settings[Tags.SIMPA_OUTPUT_PATH], data_field, wavelength)
 
         self.logger.info("Applying Gaussian Noise Model...[Done]")
@@ -11,6 +11,9 @@ from simpa.core.simulation_modules.reconstruction_module.reconstruction_utils im
 from simpa.core.device_digital_twins import DetectionGeometryBase
 from simpa.core.simulation_modules.reconstruction_module import create_reconstruction_settings
 
+# Upper bound for the number of delay dependent values (pixels times sensor elements) that are computed at once
+MAX_VALUES_PER_TILE = 2 ** 24
+
 
 class DelayAndSumAdapter(ReconstructionAdapterBase):
 
@@ -40,14 +43,20 @@ class DelayAndSumAdapter(ReconstructionAdapterBase):
         # construct output image
         output = torch.zeros((xdim, ydim, zdim), dtype=torch.float32, device=torch_device)
 
-        values, _ = compute_delay_and_sum_values(time_series_sensor_data, sensor_positions, xdim,
-                                                 ydim, zdim, xdim_start, xdim_end, ydim_start, ydim_end, zdim_start, zdim_end, spacing_in_mm, speed_of_sound_in_m_per_s,
-                                                 time_spacing_in_ms, self.logger, torch_device,
-                                                 self.component_settings)
-
-        _sum = torch.sum(values, dim=3)
-        counter = torch.count_nonzero(values, dim=3)
-        torch.divide(_sum, counter, out=output)
+        # The image is reconstructed in tiles along the x axis, such that the delay dependent values, which hold an
+        # entry for every pair of pixel and sensor element, only have to be kept in memory for one tile at a time
+        tile_size = max(1, MAX_VALUES_PER_TILE // (ydim * zdim * time_series_sensor_data.shape[0]))
+        for tile_start in range(0, xdim, tile_size):
+            x_slice = slice(tile_start, tile_start + tile_size)
+            values, _ = compute_delay_and_sum_values(time_series_sensor_data, sensor_positions, xdim,
+                                                     ydim, zdim, xdim_start, xdim_end, ydim_start, ydim_end, zdim_start, zdim_end, spacing_in_mm, speed_of_sound_in_m_per_s,
+                                                     time_spacing_in_ms, self.logger, torch_device,
+                                                     self.component_settings, x_slice=x_slice)
+
+            _sum = torch.sum(values, dim=3)
+            counter = torch.count_nonzero(values, dim=3)
+            torch.divide(_sum, counter, out=output[x_slice])
+            del values
 
         reconstructed = output.cpu().numpy()
 
@@ -45,6 +45,9 @@ class DelayMultiplyAndSumAdapter(ReconstructionAdapterBase):
                                                                  zdim_start, zdim_end, spacing_in_mm, speed_of_sound_in_m_per_s,
                                                                  time_spacing_in_ms, self.logger, torch_device,
                                                                  self.component_settings)
+        # The signed roots of the pairwise products are accumulated over all pairs of sensor elements, which is
+        # prone to cancellation in single precision. Hence, the products and sums are computed in double precision.
+        values = values.to(torch.float64)
 
         for x in range(xdim):
             yy, zz, nn, mm = torch.meshgrid(torch.arange(ydim, device=torch_device),
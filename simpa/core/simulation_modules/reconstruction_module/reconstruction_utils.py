@@ -311,10 +311,10 @@ def apply_b_mode(data: np.ndarray = None, method: str = None) -> np.ndarray:
     else:
         print("You have not specified a B-mode method")
         output = data
-
-    # sanity check that no elements are below zero
-    if output[output < 0].sum() != 0:
-        print("There are still negative values in the data.")
+        # sanity check that no elements are below zero, the absolute values computed by the B-mode methods cannot
+        # be negative, hence only unprocessed data requires another pass over the array
+        if np.any(output < 0):
+            print("There are still negative values in the data.")
 
     return output
 
@@ -511,9 +511,11 @@ def compute_delay_and_sum_values(time_series_sensor_data: Tensor, sensor_positio
                                  ydim: int, zdim: int, xdim_start: int, xdim_end: int, ydim_start: int, ydim_end: int,
                                  zdim_start: int, zdim_end: int, spacing_in_mm: float, speed_of_sound_in_m_per_s: float,
                                  time_spacing_in_ms: float, logger: Logger, torch_device: torch.device,
-                                 component_settings: Settings) -> Tuple[torch.tensor, int]:
+                                 component_settings: Settings, x_slice: slice = None) -> Tuple[torch.tensor, int]:
     """
     Perform the core computation of Delay and Sum, without summing up the delay dependend values.
+    If `x_slice` is given, the values are only computed for this slice of the pixels along the x axis, which allows
+    to process the image in tiles.
 
     Returns
     - values (torch tensor) of the time series data corrected for delay and sensor positioning, ready to be summed up
@@ -533,42 +535,52 @@ def compute_delay_and_sum_values(time_series_sensor_data: Tensor, sensor_positio
     # sensor positions, add an offset of 0.5 pixels if the dimension is even
 
     x = xdim_start + torch.arange(xdim, device=torch_device, dtype=torch.float32) + x_offset
+    if x_slice is not None:
+        x = x[x_slice]
     y = ydim_start + torch.arange(ydim, device=torch_device, dtype=torch.float32)
     if zdim == 1:
         z = torch.arange(zdim, device=torch_device, dtype=torch.float32)
     else:
         z = zdim_start + torch.arange(zdim, device=torch_device, dtype=torch.float32)
-    j = torch.arange(n_sensor_elements, device=torch_device, dtype=torch.float32)
 
-    xx, yy, zz, jj = torch.meshgrid(x, y, z, j)
-    jj = jj.long()
+    # The sensor positions are split into one contiguous single precision vector per axis (in the order of the
+    # pixel axes they are compared to), such that the delays are computed in the precision of the pixel coordinates.
+    sensor_x, sensor_z, sensor_y = sensor_positions[:n_sensor_elements].T.to(torch.float32).contiguous()
 
-    delays = torch.sqrt((yy * spacing_in_mm - sensor_positions[:, 2][jj]) ** 2 +
-                        (xx * spacing_in_mm - sensor_positions[:, 0][jj]) ** 2 +
-                        (zz * spacing_in_mm - sensor_positions[:, 1][jj]) ** 2) \
+    # The pixel coordinates of each axis are broadcast against the sensor positions, such that the delays are computed
+    # without allocating coordinate grids and sensor index grids of the full (x, y, z, sensor) shape.
+    delays = torch.sqrt((y[None, :, None, None] * spacing_in_mm - sensor_y) ** 2 +
+                        (x[:, None, None, None] * spacing_in_mm - sensor_x) ** 2 +
+                        (z[None, None, :, None] * spacing_in_mm - sensor_z) ** 2) \
         / (speed_of_sound_in_m_per_s * time_spacing_in_ms)
 
     # perform index validation
-    invalid_indices = torch.where(torch.logical_or(delays < 0, delays >= float(time_series_sensor_data.shape[1])))
-    torch.clip_(delays, min=0, max=time_series_sensor_data.shape[1] - 1)
+    n_time_steps = time_series_sensor_data.shape[1]
+    invalid_indices = torch.logical_or(delays < 0, delays >= float(n_time_steps))
+    torch.clip_(delays, min=0, max=n_time_steps - 1)
 
-    # interpolation of delays
+    # interpolation of delays, the samples are gathered from the flattened time series by adding the offset of the
+    # respective sensor element to the time index
     lower_delays = (torch.floor(delays)).long()
     upper_delays = lower_delays + 1
-    torch.clip_(upper_delays, min=0, max=time_series_sensor_data.shape[1] - 1)
-    lower_values = time_series_sensor_data[jj, lower_delays]
-    upper_values = time_series_sensor_data[jj, upper_delays]
+    torch.clip_(upper_delays, min=0, max=n_time_steps - 1)
+    sensor_offsets = torch.arange(n_sensor_elements, device=torch_device) * n_time_steps
+    lower_values = torch.take(time_series_sensor_data, lower_delays + sensor_offsets)
+    upper_values = torch.take(time_series_sensor_data, upper_delays + sensor_offsets)
     values = lower_values * (upper_delays - delays) + upper_values * (delays - lower_delays)
+    del lower_values, upper_values, lower_delays, upper_delays
 
-    # perform apodization if specified
-    if Tags.RECONSTRUCTION_APODIZATION_METHOD in component_settings:
+    # perform apodization if specified, the box window weights all sensor elements with one and is hence skipped
+    if Tags.RECONSTRUCTION_APODIZATION_METHOD in component_settings and \
+            component_settings[Tags.RECONSTRUCTION_APODIZATION_METHOD] in (Tags.RECONSTRUCTION_APODIZATION_HANN,
+                                                                           Tags.RECONSTRUCTION_APODIZATION_HAMMING):
         apodization = get_apodization_factor(apodization_method=component_settings[Tags.RECONSTRUCTION_APODIZATION_METHOD],
-                                             dimensions=(xdim, ydim, zdim), n_sensor_elements=n_sensor_elements,
+                                             dimensions=(len(x), ydim, zdim), n_sensor_elements=n_sensor_elements,
                                              device=torch_device)
-        values = values * apodization
+        values *= apodization
 
     # set values of invalid indices to 0 so that they don't influence the result
-    values[invalid_indices] = 0
+    values.masked_fill_(invalid_indices, 0)
 
     del delays  # free memory of delays
 
@@ -27,28 +27,70 @@ class VolumeCreatorModuleBase(SimulationModule):
         self.torch_device = get_processing_device(self.global_settings)
 
     def create_empty_volumes(self):
-        volumes = dict()
         volume_x_dim, volume_y_dim, volume_z_dim = self.global_settings.get_volume_dimensions_voxels()
         sizes = (volume_x_dim, volume_y_dim, volume_z_dim)
 
         wavelength = self.global_settings[Tags.WAVELENGTH]
         first_wavelength = self.global_settings[Tags.WAVELENGTHS][0]
 
-        for key in TissueProperties.property_tags:
-            # Create wavelength-independent properties only in the first wavelength run
-            if key in TissueProperties.wavelength_independent_properties and wavelength != first_wavelength:
-                continue
-            volumes[key] = torch.zeros(sizes, dtype=torch.float, device=self.torch_device)
+        # Create wavelength-independent properties only in the first wavelength run
+        if wavelength == first_wavelength:
+            keys = TissueProperties.property_tags
+        else:
+            keys = TissueProperties.wavelength_dependent_properties
+
+        # All volumes are views into one contiguous block, which requires only a single allocation.
+        # The views keep the underlying storage alive.
+        storage = torch.zeros((len(keys), *sizes), dtype=torch.float, device=self.torch_device)
+        volumes = {key: storage[index] for index, key in enumerate(keys)}
 
         return volumes, volume_x_dim, volume_y_dim, volume_z_dim
 
+    def move_to_processing_device(self, array: np.ndarray, dtype: torch.dtype = None) -> torch.Tensor:
+        """
+        Moves the given array to the processing device.
+
+        :param array: the array to move
+        :param dtype: optional torch data type the array is converted to
+        :return: torch tensor on the processing device
+        """
+        if isinstance(array, np.ndarray) and not array.flags.writeable:
+            # torch does not support read-only memory such as broadcast views, hence these arrays are copied
+            array = np.array(array)
+        return torch.as_tensor(array, dtype=dtype, device=self.torch_device)
+
+    def convert_volumes_to_numpy(self, volumes: dict) -> dict:
+        """
+        Converts the given torch tensors into numpy arrays. Entries that already are numpy arrays are kept as they are.
+        The volumes are kept in the single precision they were computed in, which halves the memory footprint
+        and the amount of data written to the HDF5 file compared to an upcast to double precision.
+        All device to host copies of GPU tensors are issued asynchronously into page-locked memory such that the
+        transfers are only waited for once.
+
+        :param volumes: dictionary of torch tensors or numpy arrays
+        :return: dictionary with the same keys containing numpy arrays
+        """
+        host_volumes = dict()
+        for key, volume in volumes.items():
+            if torch.is_tensor(volume) and volume.is_cuda:
+                host_volumes[key] = torch.empty(volume.shape, dtype=volume.dtype, pin_memory=True)
+                host_volumes[key].copy_(volume, non_blocking=True)
+            else:
+                host_volumes[key] = volume
+        if self.torch_device.type == "cuda":
+            torch.cuda.synchronize(self.torch_device)
+
+        return {key: volume.numpy() if torch.is_tensor(volume) else volume for key, volume in host_volumes.items()}
+
     @abstractmethod
     def create_simulation_volume(self) -> dict:
         """
         This method creates an in silico representation of a tissue as described in the settings file that is given.
 
         :return: A dictionary containing optical and acoustic properties as well as other characteristics of the
-            simulated volume such as oxygenation, and a segmentation mask. All of these are given as 3d numpy arrays.
+            simulated volume such as oxygenation, and a segmentation mask. All of these are given as 3d numpy arrays
+            or as 3d torch tensors on the processing device, which are only copied to the host after the quality
+            assurance checks.
         :rtype: dict
         """
         pass
@@ -57,14 +99,26 @@ class VolumeCreatorModuleBase(SimulationModule):
         self.logger.info("VOLUME CREATION")
 
         volumes = self.create_simulation_volume()
-        # explicitly empty cache to free reserved GPU memory after volume creation
-        torch.cuda.empty_cache()
+        if Tags.FORCE_EMPTY_CUDA_CACHE in self.global_settings and self.global_settings[Tags.FORCE_EMPTY_CUDA_CACHE]:
+            # explicitly empty cache to free reserved GPU memory after volume creation
+            torch.cuda.empty_cache()
 
-        if not (Tags.IGNORE_QA_ASSERTIONS in self.global_settings and self.global_settings[Tags.IGNORE_QA_ASSERTIONS]):
+        run_qa_assertions = not (Tags.IGNORE_QA_ASSERTIONS in self.global_settings and
+                                 self.global_settings[Tags.IGNORE_QA_ASSERTIONS])
+        if run_qa_assertions:
             assert_equal_shapes(list(volumes.values()))
+            # The reductions are enqueued on the processing device together with the copies to the host, such that
+            # the quality assurance does not require a synchronisation of its own.
+            volumes_well_defined = [torch.isfinite(torch.as_tensor(volume)).all()
+                                    for _volume_name, volume in volumes.items()
+                                    # oxygenation can have NaN by definition
+                                    if _volume_name != Tags.DATA_FIELD_OXYGENATION]
+
+        volumes = self.convert_volumes_to_numpy(volumes)
+
+        if run_qa_assertions and not all(volumes_well_defined):
             for _volume_name in volumes.keys():
                 if _volume_name == Tags.DATA_FIELD_OXYGENATION:
-                    # oxygenation can have NaN by definition
                     continue
                 assert_array_well_defined(volumes[_volume_name], array_name=_volume_name)
 
@@ -64,11 +64,16 @@ class ModelBasedVolumeCreationAdapter(VolumeCreatorModuleBase):
                                               dtype=torch.float, device=self.torch_device)
         max_added_fractions = torch.zeros((x_dim_px, y_dim_px, z_dim_px), dtype=torch.float, device=self.torch_device)
         wavelength = self.global_settings[Tags.WAVELENGTH]
+        # The properties of molecular compositions that are shared by several structures are only computed once.
+        properties_by_composition = dict()
 
         for structure in priority_sorted_structures(self.global_settings, self.component_settings):
             self.logger.debug(type(structure))
 
-            structure_properties = structure.properties_for_wavelength(self.global_settings, wavelength)
+            if id(structure.molecule_composition) not in properties_by_composition:
+                properties_by_composition[id(structure.molecule_composition)] = \
+                    structure.properties_for_wavelength(self.global_settings, wavelength)
+            structure_properties = properties_by_composition[id(structure.molecule_composition)]
 
             structure_volume_fractions = torch.as_tensor(
                 structure.geometrical_volume, dtype=torch.float, device=self.torch_device)
@@ -91,9 +96,9 @@ class ModelBasedVolumeCreationAdapter(VolumeCreatorModuleBase):
                     continue
                 if key == Tags.DATA_FIELD_SEGMENTATION:
                     added_fraction_greater_than_any_added_fraction = added_volume_fraction > max_added_fractions
-                    volumes[key][added_fraction_greater_than_any_added_fraction & mask] = structure_properties[key]
-                    max_added_fractions[added_fraction_greater_than_any_added_fraction & mask] = \
-                        added_volume_fraction[added_fraction_greater_than_any_added_fraction & mask]
+                    segmentation_mask = added_fraction_greater_than_any_added_fraction & mask
+                    volumes[key].masked_fill_(segmentation_mask, structure_properties[key])
+                    max_added_fractions[segmentation_mask] = added_volume_fraction[segmentation_mask]
                 else:
                     if isinstance(structure_properties[key], np.ndarray):
                         volumes[key][mask] += added_volume_fraction[mask] * structure_properties[key][mask]
@@ -105,8 +110,4 @@ class ModelBasedVolumeCreationAdapter(VolumeCreatorModuleBase):
 
             global_volume_fractions[mask] += added_volume_fraction[mask]
 
-        # convert volumes back to CPU
-        for key in volumes.keys():
-            volumes[key] = volumes[key].cpu().numpy().astype(np.float64, copy=False)
-
         return volumes
@@ -26,38 +26,93 @@ class SegmentationBasedVolumeCreationAdapter(VolumeCreatorModuleBase):
         wavelength = self.global_settings[Tags.WAVELENGTH]
 
         segmentation_volume = self.component_settings[Tags.INPUT_SEGMENTATION_VOLUME]
-        segmentation_classes = np.unique(segmentation_volume, return_counts=False)
-        x_dim_seg_px, y_dim_seg_px, z_dim_seg_px = np.shape(segmentation_volume)
-
-        if x_dim_px != x_dim_seg_px:
-            raise ValueError("x_dim of volumes and segmentation must perfectly match but was {} and {}"
-                             .format(x_dim_px, x_dim_seg_px))
-        if y_dim_px != y_dim_seg_px:
-            raise ValueError("y_dim of volumes and segmentation must perfectly match but was {} and {}"
-                             .format(y_dim_px, y_dim_seg_px))
-        if z_dim_px != z_dim_seg_px:
-            raise ValueError("z_dim of volumes and segmentation must perfectly match but was {} and {}"
-                             .format(z_dim_px, z_dim_seg_px))
+        if segmentation_volume.shape != (x_dim_px, y_dim_px, z_dim_px):
+            raise ValueError("The dimensions of volumes and segmentation must perfectly match but were {} and {}"
+                             .format((x_dim_px, y_dim_px, z_dim_px), segmentation_volume.shape))
 
-        class_mapping = self.component_settings[Tags.SEGMENTATION_CLASS_MAPPING]
+        # The segmentation labels are mapped onto contiguous class indices [0, number of classes). Like this, all
+        # scalar properties can be assigned to the entire volume with a single gather from a per-class lookup table
+        # instead of one masked write per class and property.
+        if segmentation_volume.dtype == np.uint8:
+            # uint8 labels are non-negative and bounded by 255, hence they need neither a range check nor a cast
+            labels_can_be_encoded = True
+        elif np.issubdtype(segmentation_volume.dtype, np.integer):
+            max_label = segmentation_volume.max()
+            labels_can_be_encoded = segmentation_volume.min() >= 0 and max_label < segmentation_volume.size
+            if labels_can_be_encoded:
+                # The labels are cast to the smallest sufficient integer type, which reduces the amount of memory
+                # that has to be transferred to the processing device.
+                if max_label <= np.iinfo(np.uint8).max:
+                    segmentation_volume = segmentation_volume.astype(np.uint8, copy=False)
+                elif max_label <= np.iinfo(np.int16).max:
+                    segmentation_volume = segmentation_volume.astype(np.int16, copy=False)
+                elif max_label <= np.iinfo(np.int32).max:
+                    segmentation_volume = segmentation_volume.astype(np.int32, copy=False)
+        else:
+            labels_can_be_encoded = False
+
+        if labels_can_be_encoded:
+            segmentation_tensor = self.move_to_processing_device(segmentation_volume)
 
+            # non-negative integer labels are encoded in linear time with a label to class index lookup table
+            label_is_present = torch.bincount(segmentation_tensor.flatten()) > 0
+            segmentation_classes = torch.nonzero(label_is_present).flatten()
+            # int32 is the narrowest index type supported by index_select, hence the narrower labels are only widened
+            # to it and the class index volume is kept in it
+            labels = segmentation_tensor.flatten()
+            if labels.dtype not in (torch.int32, torch.int64):
+                labels = labels.int()
+            label_to_class_index = (torch.cumsum(label_is_present, dim=0) - 1).int()
+            class_index_volume = torch.index_select(label_to_class_index, 0, labels)
+        else:
+            segmentation_tensor = self.move_to_processing_device(segmentation_volume)
+            segmentation_classes, class_index_volume = torch.unique(segmentation_tensor, return_inverse=True)
+        segmentation_classes = segmentation_classes.tolist()
+
+        class_mapping = self.component_settings[Tags.SEGMENTATION_CLASS_MAPPING]
+        # The properties of molecular compositions that are assigned to several classes are only computed once.
+        properties_by_composition = dict()
+        class_properties = list()
         for seg_class in segmentation_classes:
-            class_properties = class_mapping[seg_class].get_properties_for_wavelength(self.global_settings, wavelength)
-            for prop_tag in TissueProperties.property_tags:
-                if len(np.shape(class_properties[prop_tag])) == 0: # scalar
-                    volumes[prop_tag][segmentation_volume == seg_class] = class_properties[prop_tag]
-                elif len(np.shape(class_properties[prop_tag])) == 3: # 3D map
-                    volumes[prop_tag][segmentation_volume == seg_class] = \
-                        torch.as_tensor(class_properties[prop_tag][segmentation_volume == seg_class],
-                                        dtype=torch.float, device=self.torch_device)
+            molecular_composition = class_mapping[seg_class]
+            if id(molecular_composition) not in properties_by_composition:
+                properties_by_composition[id(molecular_composition)] = \
+                    molecular_composition.get_properties_for_wavelength(self.global_settings, wavelength)
+            class_properties.append(properties_by_composition[id(molecular_composition)])
 
+        property_tags = list(volumes.keys())
+        lookup_table = np.zeros((len(property_tags), len(segmentation_classes)), dtype=np.float32)
+        property_maps = {prop_tag: dict() for prop_tag in property_tags}
+        for tag_index, prop_tag in enumerate(property_tags):
+            for class_index, seg_class in enumerate(segmentation_classes):
+                class_property = class_properties[class_index][prop_tag]
+                if len(np.shape(class_property)) == 0:  # scalar
+                    lookup_table[tag_index, class_index] = class_property
+                elif len(np.shape(class_property)) == 3:  # 3D map
+                    property_maps[prop_tag][seg_class] = class_property
                 else:
                     raise AssertionError("Properties need to either be a scalar or a 3D map.")
 
-        # convert volumes back to CPU
-        for key in volumes.keys():
-            volumes[key] = volumes[key].cpu().numpy().astype(np.float64, copy=False)
+        lookup_table = torch.as_tensor(lookup_table, device=self.torch_device)
+        class_indices = class_index_volume.flatten()
+
+        # masks of the classes with 3D property maps, computed once per class and reused for all property tags
+        class_masks = dict()
+
+        for tag_index, prop_tag in enumerate(property_tags):
+            # the scalar properties are gathered directly into the volumes allocated by create_empty_volumes
+            torch.index_select(lookup_table[tag_index], 0, class_indices, out=volumes[prop_tag].view(-1))
+
+            for seg_class, property_map in property_maps[prop_tag].items():
+                if seg_class not in class_masks:
+                    class_masks[seg_class] = segmentation_tensor == seg_class
+                property_map = self.move_to_processing_device(property_map, dtype=torch.float)
+                torch.where(class_masks[seg_class], property_map, volumes[prop_tag], out=volumes[prop_tag])
 
-        save_hdf5(self.global_settings, self.global_settings[Tags.SIMPA_OUTPUT_PATH], "/settings/")
+        # The settings are only saved in the run of the last wavelength, such that the saved settings match the last
+        # write of saving them in every run. Entries that later modules add in the same run, such as
+        # Tags.K_WAVE_SPECIFIC_DT, are not included, only those added in the runs of earlier wavelengths.
+        if wavelength == self.global_settings[Tags.WAVELENGTHS][-1]:
+            save_hdf5(self.global_settings, self.global_settings[Tags.SIMPA_OUTPUT_PATH], "/settings/")
 
         return volumes
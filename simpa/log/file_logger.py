@@ -40,7 +40,8 @@ class Logger(SerializableSIMPAClass):
             cls._logger.setLevel(logging.DEBUG)
 
             console_handler = logging.StreamHandler(stream=sys.stdout)
-            file_handler = logging.FileHandler(path, mode="w")
+            # the log file is only opened (and truncated) once the first record is emitted
+            file_handler = logging.FileHandler(path, mode="w", delay=True)
 
             console_handler.setLevel(logging.DEBUG)
             file_handler.setLevel(logging.DEBUG)
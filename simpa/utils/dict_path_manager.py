@@ -5,17 +5,15 @@
 from simpa.utils import Tags
 
 
-def generate_dict_path(data_field, wavelength: (int, float) = None) -> str:
+def _build_dict_path_table() -> dict:
     """
-    Generates a path within an hdf5 file in the SIMPA convention
+    Builds the lookup table used by generate_dict_path. It maps every data field onto the path of the data field
+    within an hdf5 file and a flag that indicates whether the path is extended by the wavelength if one is given.
 
-    :param data_field: Data field that is supposed to be stored in an hdf5 file.
-    :param wavelength: Wavelength of the current simulation.
-    :return: String which defines the path to the data_field.
+    :return: dict mapping data_field to a tuple of (dict_path, wavelength_dependent).
     """
 
-    if data_field in [Tags.SIMULATIONS, Tags.SETTINGS, Tags.DIGITAL_DEVICE, Tags.SIMULATION_PIPELINE]:
-        return "/" + data_field + "/"
+    top_level_fields = [Tags.SIMULATIONS, Tags.SETTINGS, Tags.DIGITAL_DEVICE, Tags.SIMULATION_PIPELINE]
 
     wavelength_dependent_properties = [Tags.DATA_FIELD_ABSORPTION_PER_CM,
                                        Tags.DATA_FIELD_SCATTERING_PER_CM,
@@ -30,15 +28,16 @@ def generate_dict_path(data_field, wavelength: (int, float) = None) -> str:
                                          Tags.KWAVE_PROPERTY_SENSOR_MASK,
                                          Tags.KWAVE_PROPERTY_DIRECTIVITY_ANGLE]
 
-    simulation_output = [Tags.DATA_FIELD_FLUENCE,
-                         Tags.DATA_FIELD_INITIAL_PRESSURE,
-                         Tags.OPTICAL_MODEL_UNITS,
-                         Tags.DATA_FIELD_TIME_SERIES_DATA,
-                         Tags.DATA_FIELD_RECONSTRUCTED_DATA,
-                         Tags.DATA_FIELD_DIFFUSE_REFLECTANCE,
-                         Tags.DATA_FIELD_DIFFUSE_REFLECTANCE_POS,
-                         Tags.DATA_FIELD_PHOTON_EXIT_POS,
-                         Tags.DATA_FIELD_PHOTON_EXIT_DIR]
+    optical_simulation_output = [Tags.DATA_FIELD_FLUENCE,
+                                 Tags.DATA_FIELD_INITIAL_PRESSURE,
+                                 Tags.OPTICAL_MODEL_UNITS,
+                                 Tags.DATA_FIELD_DIFFUSE_REFLECTANCE,
+                                 Tags.DATA_FIELD_DIFFUSE_REFLECTANCE_POS,
+                                 Tags.DATA_FIELD_PHOTON_EXIT_POS,
+                                 Tags.DATA_FIELD_PHOTON_EXIT_DIR]
+
+    simulation_output = [Tags.DATA_FIELD_TIME_SERIES_DATA,
+                         Tags.DATA_FIELD_RECONSTRUCTED_DATA]
 
     simulation_output_fields = [Tags.OPTICAL_MODEL_OUTPUT_NAME,
                                 Tags.SIMULATION_PROPERTIES]
@@ -47,43 +46,49 @@ def generate_dict_path(data_field, wavelength: (int, float) = None) -> str:
 
     wavelength_independent_image_processing_output = [Tags.LINEAR_UNMIXING_RESULT]
 
-    if wavelength is not None:
-        wl = "/{}/".format(wavelength)
-
-    if data_field in wavelength_dependent_properties:
-        if wavelength is not None:
-            dict_path = "/" + Tags.SIMULATIONS + "/" + Tags.SIMULATION_PROPERTIES + "/" + data_field + wl
-        else:
-            dict_path = "/" + Tags.SIMULATIONS + "/" + Tags.SIMULATION_PROPERTIES + "/" + data_field
-    elif data_field in simulation_output:
-        if data_field in [Tags.DATA_FIELD_FLUENCE, Tags.DATA_FIELD_INITIAL_PRESSURE, Tags.OPTICAL_MODEL_UNITS,
-                          Tags.DATA_FIELD_DIFFUSE_REFLECTANCE, Tags.DATA_FIELD_DIFFUSE_REFLECTANCE_POS,
-                          Tags.DATA_FIELD_PHOTON_EXIT_POS, Tags.DATA_FIELD_PHOTON_EXIT_DIR]:
-            if wavelength is not None:
-                dict_path = "/" + Tags.SIMULATIONS + "/" + Tags.OPTICAL_MODEL_OUTPUT_NAME + "/" + data_field + wl
-            else:
-                dict_path = "/" + Tags.SIMULATIONS + "/" + Tags.OPTICAL_MODEL_OUTPUT_NAME + "/" + data_field
-        else:
-            if wavelength is not None:
-                dict_path = "/" + Tags.SIMULATIONS + "/" + data_field + wl
-            else:
-                dict_path = "/" + Tags.SIMULATIONS + "/" + data_field
-
-    elif data_field in wavelength_independent_properties:
-        dict_path = "/" + Tags.SIMULATIONS + "/" + Tags.SIMULATION_PROPERTIES + "/" + data_field + "/"
-    elif data_field in simulation_output_fields:
-        dict_path = "/" + Tags.SIMULATIONS + "/" + data_field + "/"
-    elif data_field in wavelength_dependent_image_processing_output:
-        if wavelength is not None:
-            dict_path = "/" + Tags.IMAGE_PROCESSING + "/" + data_field + wl
-        else:
-            dict_path = "/" + Tags.IMAGE_PROCESSING + "/" + data_field
-
-    elif data_field in wavelength_independent_image_processing_output:
-        dict_path = "/" + Tags.IMAGE_PROCESSING + "/" + data_field + "/"
-    else:
+    properties_path = "/" + Tags.SIMULATIONS + "/" + Tags.SIMULATION_PROPERTIES + "/"
+    optical_output_path = "/" + Tags.SIMULATIONS + "/" + Tags.OPTICAL_MODEL_OUTPUT_NAME + "/"
+    simulations_path = "/" + Tags.SIMULATIONS + "/"
+    image_processing_path = "/" + Tags.IMAGE_PROCESSING + "/"
+
+    # The categories are given in order of precedence. If a data field is contained in several of them,
+    # the first one determines its path.
+    categories = [(top_level_fields, "/", "/", False),
+                  (wavelength_dependent_properties, properties_path, "", True),
+                  (optical_simulation_output, optical_output_path, "", True),
+                  (simulation_output, simulations_path, "", True),
+                  (wavelength_independent_properties, properties_path, "/", False),
+                  (simulation_output_fields, simulations_path, "/", False),
+                  (wavelength_dependent_image_processing_output, image_processing_path, "", True),
+                  (wavelength_independent_image_processing_output, image_processing_path, "/", False)]
+
+    dict_path_table = dict()
+    for data_fields, prefix, suffix, wavelength_dependent in categories:
+        for data_field in data_fields:
+            dict_path_table.setdefault(data_field, (prefix + data_field + suffix, wavelength_dependent))
+    return dict_path_table
+
+
+_DICT_PATH_TABLE = _build_dict_path_table()
+
+
+def generate_dict_path(data_field, wavelength: (int, float) = None) -> str:
+    """
+    Generates a path within an hdf5 file in the SIMPA convention
+
+    :param data_field: Data field that is supposed to be stored in an hdf5 file.
+    :param wavelength: Wavelength of the current simulation.
+    :return: String which defines the path to the data_field.
+    """
+
+    try:
+        dict_path, wavelength_dependent = _DICT_PATH_TABLE[data_field]
+    except (KeyError, TypeError):
         raise ValueError("The requested data_field is not a valid argument. Please specify a valid data_field using "
-                         "the Tags from simpa/utils/tags.py!")
+                         "the Tags from simpa/utils/tags.py!") from None
+
+    if wavelength_dependent and wavelength is not None:
+        dict_path += "/{}/".format(wavelength)
 
     return dict_path
 
@@ -1,6 +1,6 @@
 import numpy as np
 from sklearn.datasets import make_blobs
-from scipy.ndimage.filters import gaussian_filter
+from scipy.ndimage import gaussian_filter
 
 
 class HeterogeneityGeneratorBase(object):
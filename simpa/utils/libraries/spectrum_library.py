@@ -5,6 +5,8 @@
 import os
 import inspect
 import glob
+from collections.abc import Hashable
+from functools import lru_cache
 import numpy as np
 import matplotlib.pylab as plt
 from simpa.utils.libraries.literature_values import OpticalTissueProperties
@@ -69,10 +71,51 @@ class Spectrum(SerializableSIMPAClass, object):
         return deserialized_spectrum
 
 
+@lru_cache(maxsize=None)
+def _load_spectrum(file_path: str, modification_time_ns: int) -> Spectrum:
+    """
+    Loads and interpolates the spectrum stored in the given npz file. The result is cached, such that the libraries,
+    which are instantiated for every molecule, do not re-read the files from disk. The modification time is part of
+    the cache key, such that changed files are reloaded.
+
+    :param file_path: path to the npz file
+    :param modification_time_ns: modification time of the file
+    :return: the loaded spectrum
+    """
+    name = file_path.split(os.path.sep)[-1][:-4]
+    numpy_data = np.load(file_path)
+    values = numpy_data["values"]
+    wavelengths = numpy_data["wavelengths"]
+    return Spectrum(spectrum_name=name, values=values, wavelengths=wavelengths)
+
+
+def _create_constant_spectrum(spectrum_name: str, value) -> Spectrum:
+    return Spectrum(spectrum_name, np.asarray([450, 1000]), np.asarray([value, value]))
+
+
+_cached_constant_spectrum = lru_cache(maxsize=1024, typed=True)(_create_constant_spectrum)
+
+
+def _constant_spectrum(spectrum_name: str, value) -> Spectrum:
+    """
+    Creates a spectrum with a constant value over all wavelengths. As spectra are never modified after their creation,
+    the result is cached such that molecules with the same constant property share a single spectrum instance.
+    Values that cannot be hashed, such as numpy arrays, are not cached.
+
+    :param spectrum_name: name of the spectrum
+    :param value: the constant value
+    :return: the constant spectrum
+    """
+    if isinstance(value, Hashable):
+        return _cached_constant_spectrum(spectrum_name, value)
+    return _create_constant_spectrum(spectrum_name, value)
+
+
 class SpectraLibrary(object):
 
     def __init__(self, folder_name: str, additional_folder_path: str = None):
         self.spectra = list()
+        self.spectra_by_name = dict()
         self.add_spectra_from_folder(folder_name)
         if additional_folder_path is not None:
             self.add_spectra_from_folder(additional_folder_path)
@@ -80,11 +123,10 @@ class SpectraLibrary(object):
     def add_spectra_from_folder(self, folder_name):
         base_path = os.path.dirname(os.path.abspath(inspect.getfile(inspect.currentframe())))
         for absorption_spectrum in glob.glob(os.path.join(base_path, folder_name, "*.npz")):
-            name = absorption_spectrum.split(os.path.sep)[-1][:-4]
-            numpy_data = np.load(absorption_spectrum)
-            values = numpy_data["values"]
-            wavelengths = numpy_data["wavelengths"]
-            self.spectra.append(Spectrum(spectrum_name=name, values=values, wavelengths=wavelengths))
+            spectrum = _load_spectrum(absorption_spectrum, os.stat(absorption_spectrum).st_mtime_ns)
+            self.spectra.append(spectrum)
+            # spectra that are added later take precedence, as they did in the reverse iteration over the list
+            self.spectra_by_name[spectrum.spectrum_name] = spectrum
 
     def __next__(self):
         if self.i > 0:
@@ -100,9 +142,8 @@ class SpectraLibrary(object):
         return [spectrum.spectrum_name for spectrum in self]
 
     def get_spectrum_by_name(self, spectrum_name: str) -> Spectrum:
-        for spectrum in self:
-            if spectrum.spectrum_name == spectrum_name:
-                return spectrum
+        if spectrum_name in self.spectra_by_name:
+            return self.spectra_by_name[spectrum_name]
 
         raise LookupError(
             f"No spectrum for the given name exists ({spectrum_name}). Try one of: {self.get_spectra_names()}")
@@ -115,8 +156,7 @@ class AnisotropySpectrumLibrary(SpectraLibrary):
 
     @staticmethod
     def CONSTANT_ANISOTROPY_ARBITRARY(anisotropy: float = 1):
-        return Spectrum("Constant Anisotropy (arb)", np.asarray([450, 1000]),
-                        np.asarray([anisotropy, anisotropy]))
+        return _constant_spectrum("Constant Anisotropy (arb)", anisotropy)
 
 
 class ScatteringSpectrumLibrary(SpectraLibrary):
@@ -126,8 +166,7 @@ class ScatteringSpectrumLibrary(SpectraLibrary):
 
     @staticmethod
     def CONSTANT_SCATTERING_ARBITRARY(scattering: float = 1):
-        return Spectrum("Constant Scattering (arb)", np.asarray([450, 1000]),
-                        np.asarray([scattering, scattering]))
+        return _constant_spectrum("Constant Scattering (arb)", scattering)
 
     @staticmethod
     def scattering_from_rayleigh_and_mie_theory(name: str, mus_at_500_nm: float = 1.0, fraction_rayleigh_scattering: float = 0.0,
@@ -145,8 +184,7 @@ class AbsorptionSpectrumLibrary(SpectraLibrary):
 
     @staticmethod
     def CONSTANT_ABSORBER_ARBITRARY(absorption_coefficient: float = 1):
-        return Spectrum("Constant Absorber (arb)", np.asarray([450, 1000]),
-                        np.asarray([absorption_coefficient, absorption_coefficient]))
+        return _constant_spectrum("Constant Absorber (arb)", absorption_coefficient)
 
 
 def get_simpa_internal_absorption_spectra_by_names(absorption_spectrum_names: list):
@@ -83,9 +83,11 @@ class CircularTubularStructure(GeometricalStructure):
             del deformation_values_mm
         cylinder_vector = torch.subtract(end_voxels, start_voxels)
 
-        target_radius = torch.linalg.norm(target_vector, axis=-1) * torch.sin(
+        target_vector_norm = torch.linalg.norm(target_vector, axis=-1)
+        target_radius = target_vector_norm * torch.sin(
             torch.arccos((torch.matmul(target_vector, cylinder_vector)) /
-                         (torch.linalg.norm(target_vector, axis=-1) * torch.linalg.norm(cylinder_vector))))
+                         (target_vector_norm * torch.linalg.norm(cylinder_vector))))
+        del target_vector_norm
         del target_vector
 
         volume_fractions = torch.zeros(tuple(self.volume_dimensions_voxels),
@@ -50,21 +50,18 @@ class SphericalStructure(GeometricalStructure):
         start_voxels = start_mm / self.voxel_spacing
         radius_voxels = radius_mm / self.voxel_spacing
 
-        target_vector = torch.stack(torch.meshgrid(torch.arange(start=0.5, end=self.volume_dimensions_voxels[0], device=self.torch_device),
-                                                   torch.arange(
-                                                       start=0.5, end=self.volume_dimensions_voxels[1], device=self.torch_device),
-                                                   torch.arange(
-                                                       start=0.5, end=self.volume_dimensions_voxels[2], device=self.torch_device),
-                                                   indexing='ij'), dim=-1)
-        target_vector -= start_voxels
+        # The squared distances are separable along the axes, such that the distance field can be computed from
+        # three broadcast 1D vectors instead of a stacked (x, y, z, 3) grid of target vectors.
+        x = torch.arange(start=0.5, end=self.volume_dimensions_voxels[0], device=self.torch_device) - start_voxels[0]
+        y = torch.arange(start=0.5, end=self.volume_dimensions_voxels[1], device=self.torch_device) - start_voxels[1]
+        z = torch.arange(start=0.5, end=self.volume_dimensions_voxels[2], device=self.torch_device) - start_voxels[2]
 
         if partial_volume:
             radius_margin = 0.5
         else:
             radius_margin = 0.7071
 
-        target_radius = torch.linalg.norm(target_vector, axis=-1)
-        del target_vector
+        target_radius = torch.sqrt(x[:, None, None] ** 2 + y[None, :, None] ** 2 + z[None, None, :] ** 2)
 
         volume_fractions = torch.zeros(tuple(self.volume_dimensions_voxels),
                                        dtype=torch.float, device=self.torch_device)
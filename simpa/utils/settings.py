@@ -2,6 +2,7 @@
 # SPDX-FileCopyrightText: 2021 Janek Groehl
 # SPDX-License-Identifier: MIT
 
+import sys
 from simpa.utils import Tags
 from simpa.utils.serializer import SerializableSIMPAClass
 from simpa.log import Logger
@@ -24,8 +25,10 @@ class Settings(dict, SerializableSIMPAClass):
             self.__setitem__(key, value)
 
     def __setitem__(self, key, value):
+        # Keys are interned, such that lookups with the (interned) names of the Tags can be resolved by identity.
+        # This matters for keys that are created at runtime, e.g. when loading settings from an HDF5 file.
         if isinstance(key, str):
-            super().__setitem__(key, value)
+            super().__setitem__(sys.intern(str(key)), value)
             if self.verbose:
                 self.logger.warning("The key for the Settings dictionary should be a tuple in the form of "
                                     "('{}', (data_type_1, data_type_2, ...)). "
@@ -37,37 +40,37 @@ class Settings(dict, SerializableSIMPAClass):
                             "('{}', (data_type_1, data_type_2, ...)). "
                             "The tuple of data types specifies all possible types, the value can have.".format(key))
         if isinstance(value, key[1]):
-            super().__setitem__(key[0], value)
+            super().__setitem__(sys.intern(str(key[0])), value)
         else:
             raise ValueError("The value {} ({}) for the key '{}' has to be an instance of: "
                              "{}".format(value, type(value), key[0], key[1]))
 
+    # Values set with a Tag tuple are stored under the name of the Tag, i.e. the first element of the tuple.
+    # Hence, the name is probed first, such that the common case only requires a single string lookup.
+    # Tuple keys that were stored by bypassing __setitem__ are still found as a fallback.
+
     def __contains__(self, item):
-        if super().__contains__(item) is True:
-            return True
-        elif isinstance(item, str) is False and super().__contains__(item[0]) is True:
-            return True
-        else:
-            return False
+        if isinstance(item, tuple):
+            return super().__contains__(item[0]) or super().__contains__(item)
+        return super().__contains__(item)
 
     def __getitem__(self, item):
-        if super().__contains__(item) is True:
-            return super().__getitem__(item)
-        else:
-            try:
-                return super().__getitem__(item[0])
-            except KeyError:
-                key = item[0] if isinstance(item, tuple) else item
-                raise KeyError("The key '{}' is not in the Settings dictionary".format(key)) from None
-
-    def __delitem__(self, key):
-        if super().__contains__(key) is True:
+        key = item[0] if isinstance(item, tuple) else item
+        try:
+            return super().__getitem__(key)
+        except KeyError:
+            if key is not item and super().__contains__(item):
+                return super().__getitem__(item)
+            raise KeyError("The key '{}' is not in the Settings dictionary".format(key)) from None
+
+    def __delitem__(self, item):
+        key = item[0] if isinstance(item, tuple) else item
+        try:
             return super().__delitem__(key)
-        else:
-            try:
-                return super().__delitem__(key[0])
-            except KeyError:
-                raise KeyError("The key '{}' is not in the Settings dictionary".format(key)) from None
+        except KeyError:
+            if key is not item and super().__contains__(item):
+                return super().__delitem__(item)
+            raise KeyError("The key '{}' is not in the Settings dictionary".format(key)) from None
 
     def get_volume_dimensions_voxels(self):
         """
@@ -100,10 +103,11 @@ class Settings(dict, SerializableSIMPAClass):
         Returns the settings for the optical forward model that are saved in this settings dictionary
         """
         optical_settings = self[Tags.OPTICAL_MODEL_SETTINGS]
-        if isinstance(optical_settings, Settings):
-            return optical_settings
-        else:
-            return Settings(optical_settings)
+        if not isinstance(optical_settings, Settings):
+            # The converted settings are stored, such that plain dictionaries are only validated once
+            optical_settings = Settings(optical_settings)
+            self[Tags.OPTICAL_MODEL_SETTINGS] = optical_settings
+        return optical_settings
 
     def set_optical_settings(self, optical_settings: dict):
         """
@@ -118,10 +122,11 @@ class Settings(dict, SerializableSIMPAClass):
         Returns the settings for the optical forward model that are saved in this settings dictionary
         """
         volume_creation_settings = self[Tags.VOLUME_CREATION_MODEL_SETTINGS]
-        if isinstance(volume_creation_settings, Settings):
-            return volume_creation_settings
-        else:
-            return Settings(volume_creation_settings)
+        if not isinstance(volume_creation_settings, Settings):
+            # The converted settings are stored, such that plain dictionaries are only validated once
+            volume_creation_settings = Settings(volume_creation_settings)
+            self[Tags.VOLUME_CREATION_MODEL_SETTINGS] = volume_creation_settings
+        return volume_creation_settings
 
     def set_volume_creation_settings(self, volume_settings: dict):
         """
@@ -136,10 +141,11 @@ class Settings(dict, SerializableSIMPAClass):
         Returns the settings for the acoustic forward model that are saved in this settings dictionary
         """
         acoustic_settings = self[Tags.ACOUSTIC_MODEL_SETTINGS]
-        if isinstance(acoustic_settings, Settings):
-            return acoustic_settings
-        else:
-            return Settings(acoustic_settings)
+        if not isinstance(acoustic_settings, Settings):
+            # The converted settings are stored, such that plain dictionaries are only validated once
+            acoustic_settings = Settings(acoustic_settings)
+            self[Tags.ACOUSTIC_MODEL_SETTINGS] = acoustic_settings
+        return acoustic_settings
 
     def set_acoustic_settings(self, acoustic_settings: dict):
         """
@@ -154,10 +160,11 @@ class Settings(dict, SerializableSIMPAClass):
         Returns the settings for the reconstruction model that are saved in this settings dictionary
         """
         reconstruction_settings = self[Tags.RECONSTRUCTION_MODEL_SETTINGS]
-        if isinstance(reconstruction_settings, Settings):
-            return reconstruction_settings
-        else:
-            return Settings(reconstruction_settings)
+        if not isinstance(reconstruction_settings, Settings):
+            # The converted settings are stored, such that plain dictionaries are only validated once
+            reconstruction_settings = Settings(reconstruction_settings)
+            self[Tags.RECONSTRUCTION_MODEL_SETTINGS] = reconstruction_settings
+        return reconstruction_settings
 
     def set_reconstruction_settings(self, reconstruction_settings: dict):
         """
@@ -1433,6 +1433,14 @@ class Tags:
     Usage: core
     """
 
+    FORCE_EMPTY_CUDA_CACHE = ("force_empty_cuda_cache", (bool, np.bool_))
+    """
+    If True, the memory reserved by the torch caching allocator is released to the GPU after the volume creation of
+    every wavelength. False by default, such that the cached memory can be reused in subsequent wavelengths. Set to
+    True if subsequent simulation modules that run as separate processes on the GPU run out of memory.
+    Usage: module volume_creation_module
+    """
+
     COMPUTE_DIFFUSE_REFLECTANCE = "save_diffuse_reflectance"
     """
     Flag that indicates if the diffuse reflectance should be stored in voxels that are filled with 0 in the surrounding
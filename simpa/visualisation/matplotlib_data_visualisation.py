@@ -2,14 +2,13 @@
 # SPDX-FileCopyrightText: 2021 Janek Groehl
 # SPDX-License-Identifier: MIT
 
-from simpa.io_handling import load_hdf5
+from simpa.io_handling import load_data_field
 import matplotlib.pyplot as plt
 import matplotlib as mpl
 import numpy as np
 from simpa.utils import SegmentationClasses, Tags
 from simpa.utils.path_manager import PathManager
 from simpa.utils.settings import Settings
-from simpa.utils import get_data_field_from_simpa_output
 from simpa.log import Logger
 
 
@@ -48,8 +47,14 @@ def visualise_data(wavelength: int = None,
         path_to_hdf5_file = path_manager.get_hdf5_file_save_path() + "/" + settings[Tags.VOLUME_NAME] + ".hdf5"
 
     logger = Logger()
-    file = load_hdf5(path_to_hdf5_file)
 
+    # Only the data fields that are shown are read from the file, instead of loading the entire simulation output
+    absorption = None
+    scattering = None
+    anisotropy = None
+    segmentation_map = None
+    speed_of_sound = None
+    density = None
     fluence = None
     initial_pressure = None
     time_series_data = None
@@ -59,16 +64,22 @@ def visualise_data(wavelength: int = None,
     diffuse_reflectance = None
     diffuse_reflectance_position = None
 
-    absorption = get_data_field_from_simpa_output(file, Tags.DATA_FIELD_ABSORPTION_PER_CM, wavelength)
-    scattering = get_data_field_from_simpa_output(file, Tags.DATA_FIELD_SCATTERING_PER_CM, wavelength)
-    anisotropy = get_data_field_from_simpa_output(file, Tags.DATA_FIELD_ANISOTROPY, wavelength)
-    segmentation_map = get_data_field_from_simpa_output(file, Tags.DATA_FIELD_SEGMENTATION)
-    speed_of_sound = get_data_field_from_simpa_output(file, Tags.DATA_FIELD_SPEED_OF_SOUND)
-    density = get_data_field_from_simpa_output(file, Tags.DATA_FIELD_DENSITY)
+    if show_absorption:
+        absorption = load_data_field(path_to_hdf5_file, Tags.DATA_FIELD_ABSORPTION_PER_CM, wavelength)
+    if show_scattering:
+        scattering = load_data_field(path_to_hdf5_file, Tags.DATA_FIELD_SCATTERING_PER_CM, wavelength)
+    if show_anisotropy:
+        anisotropy = load_data_field(path_to_hdf5_file, Tags.DATA_FIELD_ANISOTROPY, wavelength)
+    if show_segmentation_map:
+        segmentation_map = load_data_field(path_to_hdf5_file, Tags.DATA_FIELD_SEGMENTATION)
+    if show_speed_of_sound:
+        speed_of_sound = load_data_field(path_to_hdf5_file, Tags.DATA_FIELD_SPEED_OF_SOUND)
+    if show_tissue_density:
+        density = load_data_field(path_to_hdf5_file, Tags.DATA_FIELD_DENSITY)
 
     if show_fluence:
         try:
-            fluence = get_data_field_from_simpa_output(file, Tags.DATA_FIELD_FLUENCE, wavelength)
+            fluence = load_data_field(path_to_hdf5_file, Tags.DATA_FIELD_FLUENCE, wavelength)
         except KeyError as e:
             logger.critical("The key " + str(Tags.DATA_FIELD_FLUENCE) + " was not in the simpa output.")
             show_fluence = False
@@ -76,12 +87,12 @@ def visualise_data(wavelength: int = None,
 
     if show_diffuse_reflectance:
         try:
-            diffuse_reflectance = get_data_field_from_simpa_output(file,
-                                                                   Tags.DATA_FIELD_DIFFUSE_REFLECTANCE,
-                                                                   wavelength)
-            diffuse_reflectance_position = get_data_field_from_simpa_output(file,
-                                                                            Tags.DATA_FIELD_DIFFUSE_REFLECTANCE_POS,
-                                                                            wavelength)
+            diffuse_reflectance = load_data_field(path_to_hdf5_file,
+                                                  Tags.DATA_FIELD_DIFFUSE_REFLECTANCE,
+                                                  wavelength)
+            diffuse_reflectance_position = load_data_field(path_to_hdf5_file,
+                                                           Tags.DATA_FIELD_DIFFUSE_REFLECTANCE_POS,
+                                                           wavelength)
         except KeyError as e:
             logger.critical("The key " + str(Tags.DATA_FIELD_FLUENCE) + " was not in the simpa output.")
             show_fluence = False
@@ -89,7 +100,7 @@ def visualise_data(wavelength: int = None,
 
     if show_initial_pressure:
         try:
-            initial_pressure = get_data_field_from_simpa_output(file, Tags.DATA_FIELD_INITIAL_PRESSURE, wavelength)
+            initial_pressure = load_data_field(path_to_hdf5_file, Tags.DATA_FIELD_INITIAL_PRESSURE, wavelength)
         except KeyError as e:
             logger.critical("The key " + str(Tags.DATA_FIELD_INITIAL_PRESSURE) + " was not in the simpa output.")
             show_initial_pressure = False
@@ -97,7 +108,7 @@ def visualise_data(wavelength: int = None,
 
     if show_time_series_data:
         try:
-            time_series_data = get_data_field_from_simpa_output(file, Tags.DATA_FIELD_TIME_SERIES_DATA, wavelength)
+            time_series_data = load_data_field(path_to_hdf5_file, Tags.DATA_FIELD_TIME_SERIES_DATA, wavelength)
         except KeyError as e:
             logger.critical("The key " + str(Tags.DATA_FIELD_TIME_SERIES_DATA) + " was not in the simpa output.")
             show_time_series_data = False
@@ -105,7 +116,7 @@ def visualise_data(wavelength: int = None,
 
     if show_reconstructed_data:
         try:
-            reconstructed_data = get_data_field_from_simpa_output(file, Tags.DATA_FIELD_RECONSTRUCTED_DATA, wavelength)
+            reconstructed_data = load_data_field(path_to_hdf5_file, Tags.DATA_FIELD_RECONSTRUCTED_DATA, wavelength)
         except KeyError as e:
             logger.critical("The key " + str(Tags.DATA_FIELD_RECONSTRUCTED_DATA) + " was not in the simpa output.")
             show_reconstructed_data = False
@@ -113,7 +124,7 @@ def visualise_data(wavelength: int = None,
 
     if show_oxygenation:
         try:
-            oxygenation = get_data_field_from_simpa_output(file, Tags.DATA_FIELD_OXYGENATION, wavelength)
+            oxygenation = load_data_field(path_to_hdf5_file, Tags.DATA_FIELD_OXYGENATION, wavelength)
         except KeyError as e:
             logger.critical("The key " + str(Tags.DATA_FIELD_OXYGENATION) + " was not in the simpa output.")
             show_oxygenation = False
@@ -121,7 +132,7 @@ def visualise_data(wavelength: int = None,
 
     if show_linear_unmixing_sO2:
         try:
-            linear_unmixing_output = get_data_field_from_simpa_output(file, Tags.LINEAR_UNMIXING_RESULT)
+            linear_unmixing_output = load_data_field(path_to_hdf5_file, Tags.LINEAR_UNMIXING_RESULT)
             linear_unmixing_sO2 = linear_unmixing_output["sO2"]
         except KeyError as e:
             logger.critical("The key " + str(Tags.LINEAR_UNMIXING_RESULT) + " was not in the simpa output or blood "
@@ -28,28 +28,37 @@ label_mask = np.digitize(label_mask, bins=np.linspace(0.0, 1.0, 11), right=True)
 label_mask = np.reshape(label_mask, (400, 1, 400))
 
 input_spacing = 0.2
-segmentation_volume_tiled = np.tile(label_mask, (1, 128, 1))
-segmentation_volume_mask = np.round(zoom(segmentation_volume_tiled, input_spacing/target_spacing,
-                                         order=0)).astype(int)
+# The phantom is constant along the y-axis, hence it suffices to resample the 2D slice (nearest neighbour is
+# separable per axis) and to replicate the result along y, instead of resampling the tiled 3D volume.
+zoom_factor = input_spacing/target_spacing
+if not np.isclose(zoom_factor, 1.0):
+    label_mask = np.round(zoom(label_mask, (zoom_factor, 1, zoom_factor), order=0))
+label_mask = label_mask.astype(np.uint8)
+# The slices are only read, hence a broadcast view suffices instead of a tiled copy
+segmentation_volume_mask = np.broadcast_to(label_mask, (label_mask.shape[0], int(round(128 * zoom_factor)),
+                                                        label_mask.shape[2]))
 
 
 def segmentation_class_mapping():
+    # Classes with the same tissue share a single molecular composition, such that its properties are only
+    # computed once per wavelength.
+    heavy_water = sp.TISSUE_LIBRARY.heavy_water()
     ret_dict = dict()
-    ret_dict[0] = sp.TISSUE_LIBRARY.heavy_water()
+    ret_dict[0] = heavy_water
     ret_dict[1] = sp.TISSUE_LIBRARY.blood()
     ret_dict[2] = sp.TISSUE_LIBRARY.epidermis()
     ret_dict[3] = sp.TISSUE_LIBRARY.muscle()
     ret_dict[4] = sp.TISSUE_LIBRARY.mediprene()
     ret_dict[5] = sp.TISSUE_LIBRARY.ultrasound_gel()
-    ret_dict[6] = sp.TISSUE_LIBRARY.heavy_water()
+    ret_dict[6] = heavy_water
     ret_dict[7] = (sp.MolecularCompositionGenerator()
                    .append(sp.MOLECULE_LIBRARY.oxyhemoglobin(0.01))
                    .append(sp.MOLECULE_LIBRARY.deoxyhemoglobin(0.01))
                    .append(sp.MOLECULE_LIBRARY.water(0.98))
                    .get_molecular_composition(sp.SegmentationClasses.COUPLING_ARTIFACT))
-    ret_dict[8] = sp.TISSUE_LIBRARY.heavy_water()
-    ret_dict[9] = sp.TISSUE_LIBRARY.heavy_water()
-    ret_dict[10] = sp.TISSUE_LIBRARY.heavy_water()
+    ret_dict[8] = heavy_water
+    ret_dict[9] = heavy_water
+    ret_dict[10] = heavy_water
     return ret_dict
 
 
@@ -34,18 +34,7 @@ class TestSpheres(unittest.TestCase):
         )
 
     def assert_values(self, volume, values):
-        assert abs(volume[0][0][0] - values[0]) < 1e-5, "excpected " + \
-            str(values[0]) + " but was " + str(volume[0][0][0])
-        assert abs(volume[0][0][1] - values[1]) < 1e-5, "excpected " + \
-            str(values[1]) + " but was " + str(volume[0][0][1])
-        assert abs(volume[0][0][2] - values[2]) < 1e-5, "excpected " + \
-            str(values[2]) + " but was " + str(volume[0][0][2])
-        assert abs(volume[0][0][3] - values[3]) < 1e-5, "excpected " + \
-            str(values[3]) + " but was " + str(volume[0][0][3])
-        assert abs(volume[0][0][4] - values[4]) < 1e-5, "excpected " + \
-            str(values[4]) + " but was " + str(volume[0][0][4])
-        assert abs(volume[0][0][5] - values[5]) < 1e-5, "excpected " + \
-            str(values[5]) + " but was " + str(volume[0][0][5])
+        np.testing.assert_allclose(volume[0, 0, :len(values)], values, rtol=0, atol=1e-5)
 
     def test_spherical_structures_partial_volume_within_one_voxel(self):
         self.sphere_settings[Tags.STRUCTURE_START_MM] = [0.5, 0.5, 0.5]
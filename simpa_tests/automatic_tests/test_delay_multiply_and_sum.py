@@ -0,0 +1,85 @@
+# SPDX-FileCopyrightText: 2021 Division of Intelligent Medical Systems, DKFZ
+# SPDX-FileCopyrightText: 2021 Janek Groehl
+# SPDX-License-Identifier: MIT
+
+import unittest
+import numpy as np
+from simpa.utils import Tags
+from simpa.core.device_digital_twins import LinearArrayDetectionGeometry
+from simpa.core.simulation_modules.reconstruction_module import create_reconstruction_settings
+from simpa.core.simulation_modules.reconstruction_module.reconstruction_module_delay_multiply_and_sum_adapter import \
+    DelayMultiplyAndSumAdapter
+from simpa.core.simulation_modules.reconstruction_module.reconstruction_module_signed_delay_multiply_and_sum_adapter \
+    import SignedDelayMultiplyAndSumAdapter
+from simpa.core.simulation_modules.reconstruction_module.reconstruction_utils import \
+    preparing_reconstruction_and_obtaining_reconstruction_settings, compute_image_dimensions
+
+# The reconstructions are compared to the double precision reference with a relative tolerance of 1e-3. Pixels close to
+# zero are compared with an absolute tolerance of 1e-4 times the maximum absolute value of the reference image.
+RELATIVE_TOLERANCE = 1e-3
+ABSOLUTE_TOLERANCE_FRACTION_OF_MAXIMUM = 1e-4
+
+
+class TestDelayMultiplyAndSum(unittest.TestCase):
+
+    def setUp(self):
+        self.detection_geometry = LinearArrayDetectionGeometry(number_detector_elements=32,
+                                                               device_position_mm=np.array([0, 0, 0]),
+                                                               field_of_view_extent_mm=np.array([-8, 8, 0, 0, 0, 16]))
+        self.time_series_data = np.random.default_rng(1234).standard_normal((32, 1000)).astype(np.float32)
+
+    def compute_double_precision_reference(self, adapter, signed: bool) -> np.ndarray:
+        """
+        Computes the (signed) delay multiply and sum reconstruction of the time series data with numpy in double
+        precision.
+        """
+        time_series_data, sensor_positions, speed_of_sound_in_m_per_s, spacing_in_mm, time_spacing_in_ms, _ = \
+            preparing_reconstruction_and_obtaining_reconstruction_settings(
+                self.time_series_data.copy(), adapter.component_settings, adapter.global_settings,
+                self.detection_geometry, adapter.logger)
+        xdim, zdim, ydim, xdim_start, _, ydim_start, _, zdim_start, _ = compute_image_dimensions(
+            self.detection_geometry, spacing_in_mm, adapter.logger)
+        time_series_data = time_series_data.numpy().astype(np.float64)
+        sensor_positions = sensor_positions.numpy().astype(np.float64)
+        if zdim == 1:
+            sensor_positions[:, 1] = 0
+
+        x = xdim_start + np.arange(xdim) + (0.5 if xdim % 2 == 0 else 0)
+        y = ydim_start + np.arange(ydim)
+        z = np.arange(zdim) if zdim == 1 else zdim_start + np.arange(zdim)
+        delays = np.sqrt((x[:, None, None, None] * spacing_in_mm - sensor_positions[:, 0]) ** 2 +
+                         (y[None, :, None, None] * spacing_in_mm - sensor_positions[:, 2]) ** 2 +
+                         (z[None, None, :, None] * spacing_in_mm - sensor_positions[:, 1]) ** 2) \
+            / (speed_of_sound_in_m_per_s * time_spacing_in_ms)
+
+        n_sensor_elements, n_time_steps = time_series_data.shape
+        invalid_indices = (delays < 0) | (delays >= n_time_steps)
+        delays = np.clip(delays, 0, n_time_steps - 1)
+        lower_delays = np.floor(delays).astype(int)
+        upper_delays = np.minimum(lower_delays + 1, n_time_steps - 1)
+        sensor_indices = np.arange(n_sensor_elements)
+        values = (time_series_data[sensor_indices, lower_delays] * (upper_delays - delays) +
+                  time_series_data[sensor_indices, upper_delays] * (delays - lower_delays))
+        values[invalid_indices] = 0
+
+        products = values[..., :, None] * values[..., None, :]
+        reconstruction = np.triu(np.sign(products) * np.sqrt(np.abs(products)), k=1).sum(axis=(-1, -2))
+        if signed:
+            reconstruction = np.sign(values.sum(axis=-1)) * reconstruction
+        return reconstruction.squeeze()
+
+    def assert_matches_double_precision_reference(self, adapter_class, signed: bool):
+        settings = create_reconstruction_settings(sensor_spacing_in_mm=0.5,
+                                                  apodization=Tags.RECONSTRUCTION_APODIZATION_BOX)
+        settings[Tags.GPU] = False
+        adapter = adapter_class(settings)
+        reconstruction = adapter.reconstruction_algorithm(self.time_series_data.copy(), self.detection_geometry)
+        reference = self.compute_double_precision_reference(adapter, signed)
+        np.testing.assert_allclose(reconstruction, reference, rtol=RELATIVE_TOLERANCE,
+                                   atol=ABSOLUTE_TOLERANCE_FRACTION_OF_MAXIMUM * np.abs(reference).max())
+
+    def test_delay_multiply_and_sum_matches_double_precision(self):
+        self.assert_matches_double_precision_reference(DelayMultiplyAndSumAdapter, signed=False)
+
+    def test_signed_delay_multiply_and_sum_matches_double_precision(self):
+        self.assert_matches_double_precision_reference(SignedDelayMultiplyAndSumAdapter, signed=True)
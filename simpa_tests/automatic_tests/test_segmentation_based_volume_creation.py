@@ -0,0 +1,109 @@
+# SPDX-FileCopyrightText: 2021 Division of Intelligent Medical Systems, DKFZ
+# SPDX-FileCopyrightText: 2021 Janek Groehl
+# SPDX-License-Identifier: MIT
+
+import unittest
+import os
+import numpy as np
+from simpa.utils import Tags, Settings, TISSUE_LIBRARY
+from simpa.utils.libraries.molecule_library import MolecularCompositionGenerator, MOLECULE_LIBRARY
+from simpa.utils.libraries.tissue_library import SegmentationClasses
+from simpa.io_handling import load_hdf5
+from simpa.core.simulation_modules.volume_creation_module.volume_creation_module_segmentation_based_adapter import \
+    SegmentationBasedVolumeCreationAdapter
+
+
+class TestSegmentationBasedVolumeCreation(unittest.TestCase):
+
+    def setUp(self):
+        self.settings = Settings()
+        self.settings[Tags.WAVELENGTHS] = [700, 800]
+        self.settings[Tags.WAVELENGTH] = 700
+        self.settings[Tags.SPACING_MM] = 1
+        self.settings[Tags.DIM_VOLUME_X_MM] = 6
+        self.settings[Tags.DIM_VOLUME_Y_MM] = 4
+        self.settings[Tags.DIM_VOLUME_Z_MM] = 5
+        self.settings[Tags.GPU] = False
+        self.settings[Tags.SIMPA_OUTPUT_PATH] = "segmentation_based_volume_creation_test.hdf5"
+
+        # deliberately use non-contiguous segmentation labels
+        self.segmentation_volume = np.zeros((6, 4, 5), dtype=int)
+        self.segmentation_volume[2:4, :, :] = 3
+        self.segmentation_volume[:, :, 4] = 7
+
+        self.class_mapping = {
+            0: TISSUE_LIBRARY.heavy_water(),
+            3: TISSUE_LIBRARY.blood(oxygenation=0.5),
+            7: TISSUE_LIBRARY.muscle()
+        }
+
+    def tearDown(self):
+        if os.path.exists(self.settings[Tags.SIMPA_OUTPUT_PATH]):
+            os.remove(self.settings[Tags.SIMPA_OUTPUT_PATH])
+
+    def create_volumes(self):
+        self.settings.set_volume_creation_settings({
+            Tags.INPUT_SEGMENTATION_VOLUME: self.segmentation_volume,
+            Tags.SEGMENTATION_CLASS_MAPPING: self.class_mapping
+        })
+        volume_creator = SegmentationBasedVolumeCreationAdapter(self.settings)
+        return volume_creator.convert_volumes_to_numpy(volume_creator.create_simulation_volume())
+
+    def test_scalar_properties_are_assigned_per_class(self):
+        volumes = self.create_volumes()
+        for seg_class, molecular_composition in self.class_mapping.items():
+            expected_properties = molecular_composition.get_properties_for_wavelength(self.settings, 700)
+            mask = self.segmentation_volume == seg_class
+            for prop_tag, volume in volumes.items():
+                self.assertEqual(volume.shape, self.segmentation_volume.shape)
+                self.assertEqual(volume.dtype, np.float32)
+                expected_property = expected_properties[prop_tag]
+                if np.shape(expected_property) == self.segmentation_volume.shape:
+                    expected_property = expected_property[mask]
+                np.testing.assert_allclose(volume[mask], expected_property, rtol=1e-5)
+
+    def test_float_segmentation_labels(self):
+        self.segmentation_volume = self.segmentation_volume.astype(float)
+        self.class_mapping = {float(seg_class): composition for seg_class, composition in self.class_mapping.items()}
+        self.test_scalar_properties_are_assigned_per_class()
+
+    def test_shared_molecular_composition(self):
+        self.class_mapping[7] = self.class_mapping[0]
+        self.test_scalar_properties_are_assigned_per_class()
+
+    def test_segmentation_shape_mismatch_raises(self):
+        self.segmentation_volume = self.segmentation_volume[:, :, :-1]
+        self.assertRaises(ValueError, self.create_volumes)
+
+    def test_wavelength_independent_properties_only_in_first_wavelength(self):
+        self.settings[Tags.WAVELENGTH] = 800
+        volumes = self.create_volumes()
+        self.assertEqual(set(volumes.keys()), {Tags.DATA_FIELD_ABSORPTION_PER_CM, Tags.DATA_FIELD_SCATTERING_PER_CM,
+                                               Tags.DATA_FIELD_ANISOTROPY})
+
+    def test_3d_property_maps_are_assigned_voxel_wise(self):
+        blood_volume_fraction = np.random.uniform(0.1, 0.9, size=self.segmentation_volume.shape)
+        self.class_mapping[3] = (MolecularCompositionGenerator()
+                                 .append(MOLECULE_LIBRARY.oxyhemoglobin(blood_volume_fraction))
+                                 .append_filler(MOLECULE_LIBRARY.water())
+                                 .get_molecular_composition(SegmentationClasses.BLOOD))
+        volumes = self.create_volumes()
+        expected_properties = self.class_mapping[3].get_properties_for_wavelength(self.settings, 700)
+        mask = self.segmentation_volume == 3
+        np.testing.assert_allclose(volumes[Tags.DATA_FIELD_ABSORPTION_PER_CM][mask],
+                                   expected_properties[Tags.DATA_FIELD_ABSORPTION_PER_CM][mask], rtol=1e-5)
+        np.testing.assert_allclose(volumes[Tags.DATA_FIELD_DENSITY][mask],
+                                   expected_properties[Tags.DATA_FIELD_DENSITY][mask], rtol=1e-5)
+
+    def test_saved_settings_match_settings_of_last_volume_creation(self):
+        for wavelength in self.settings[Tags.WAVELENGTHS]:
+            self.settings[Tags.WAVELENGTH] = wavelength
+            self.create_volumes()
+            settings_of_last_volume_creation = dict(self.settings)
+            # simulates a later simulation module that adds entries to the settings after the volume creation,
+            # these are only saved by the volume creation of a later wavelength
+            self.settings[Tags.K_WAVE_SPECIFIC_DT] = 1e-11 * wavelength
+        saved_settings = load_hdf5(self.settings[Tags.SIMPA_OUTPUT_PATH], "/settings/")
+        self.assertEqual(set(saved_settings.keys()), set(settings_of_last_volume_creation.keys()))
+        self.assertEqual(saved_settings[Tags.WAVELENGTH], self.settings[Tags.WAVELENGTHS][-1])
+        self.assertEqual(saved_settings[Tags.K_WAVE_SPECIFIC_DT], 1e-11 * self.settings[Tags.WAVELENGTHS][0])
@@ -0,0 +1,47 @@
+# SPDX-FileCopyrightText: 2021 Division of Intelligent Medical Systems, DKFZ
+# SPDX-FileCopyrightText: 2021 Janek Groehl
+# SPDX-License-Identifier: MIT
+
+import sys
+import unittest
+from simpa.utils import Tags
+from simpa.utils.settings import Settings
+
+
+class TestSettings(unittest.TestCase):
+
+    def setUp(self):
+        self.settings = Settings({Tags.VOLUME_NAME: "test"}, verbose=False)
+
+    def test_access_with_tag_and_name(self):
+        self.assertIn(Tags.VOLUME_NAME, self.settings)
+        self.assertIn(Tags.VOLUME_NAME[0], self.settings)
+        self.assertEqual(self.settings[Tags.VOLUME_NAME], "test")
+        self.assertEqual(self.settings[Tags.VOLUME_NAME[0]], "test")
+
+    def test_missing_key(self):
+        self.assertNotIn(Tags.SIMULATION_PATH, self.settings)
+        with self.assertRaises(KeyError):
+            _ = self.settings[Tags.SIMULATION_PATH]
+        with self.assertRaises(KeyError):
+            del self.settings[Tags.SIMULATION_PATH]
+
+    def test_delete_with_tag(self):
+        del self.settings[Tags.VOLUME_NAME]
+        self.assertNotIn(Tags.VOLUME_NAME, self.settings)
+
+    def test_wrong_value_type(self):
+        with self.assertRaises(ValueError):
+            self.settings[Tags.VOLUME_NAME] = 1
+
+    def test_keys_are_interned(self):
+        key = "".join(["dynamic", "_key"])
+        self.settings[key] = 1
+        stored_key = [k for k in self.settings.keys() if k == key][0]
+        self.assertIs(stored_key, sys.intern("dynamic_key"))
+
+    def test_sub_settings_are_converted_once(self):
+        self.settings[Tags.OPTICAL_MODEL_SETTINGS] = {Tags.OPTICAL_MODEL_NUMBER_PHOTONS: 1e7}
+        optical_settings = self.settings.get_optical_settings()
+        self.assertIsInstance(optical_settings, Settings)
+        self.assertIs(optical_settings, self.settings.get_optical_settings())
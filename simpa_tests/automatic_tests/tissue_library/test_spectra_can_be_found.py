@@ -3,6 +3,7 @@
 # SPDX-License-Identifier: MIT
 
 import unittest
+import numpy as np
 from simpa.utils import AbsorptionSpectrumLibrary
 from simpa.utils import ScatteringSpectrumLibrary
 from simpa.utils import AnisotropySpectrumLibrary
@@ -47,3 +48,17 @@ class TestSpectraCanBeFound(unittest.TestCase):
     @unittest.expectedFailure
     def test_anisotropy_spectra_invalid(self):
         AnisotropySpectrumLibrary().get_spectrum_by_name("This does not exist")
+
+    def test_spectra_are_shared_between_library_instances(self):
+        self.assertIs(AbsorptionSpectrumLibrary().get_spectrum_by_name("Water"),
+                      AbsorptionSpectrumLibrary().get_spectrum_by_name("Water"))
+
+    def test_constant_spectra_are_shared(self):
+        self.assertIs(AbsorptionSpectrumLibrary.CONSTANT_ABSORBER_ARBITRARY(0.5),
+                      AbsorptionSpectrumLibrary.CONSTANT_ABSORBER_ARBITRARY(0.5))
+        self.assertIsNot(AbsorptionSpectrumLibrary.CONSTANT_ABSORBER_ARBITRARY(1),
+                         AbsorptionSpectrumLibrary.CONSTANT_ABSORBER_ARBITRARY(1.0))
+
+    def test_constant_spectra_from_unhashable_values(self):
+        spectrum = AbsorptionSpectrumLibrary.CONSTANT_ABSORBER_ARBITRARY(np.array(0.5))
+        self.assertEqual(spectrum.get_value_for_wavelength(700), 0.5)
@@ -159,15 +159,19 @@ class ReconstructionAlgorithmTestBaseClass(ManualIntegrationTestClass):
         It contains a muscular background, an epidermis layer on top of the muscles
         and a blood vessel.
         """
+        # The background and the muscle layer consist of the same tissue and can share one molecular composition.
+        # The blood compositions are created per vessel, as each call draws a random oxygenation.
+        muscle = TissueLibrary().muscle()
+
         background_dictionary = Settings()
-        background_dictionary[Tags.MOLECULE_COMPOSITION] = TissueLibrary().muscle()
+        background_dictionary[Tags.MOLECULE_COMPOSITION] = muscle
         background_dictionary[Tags.STRUCTURE_TYPE] = Tags.BACKGROUND
 
         muscle_dictionary = Settings()
         muscle_dictionary[Tags.PRIORITY] = 1
         muscle_dictionary[Tags.STRUCTURE_START_MM] = [0, 0, 0]
         muscle_dictionary[Tags.STRUCTURE_END_MM] = [0, 0, 100]
-        muscle_dictionary[Tags.MOLECULE_COMPOSITION] = TissueLibrary().muscle()
+        muscle_dictionary[Tags.MOLECULE_COMPOSITION] = muscle
         muscle_dictionary[Tags.CONSIDER_PARTIAL_VOLUME] = True
         muscle_dictionary[Tags.ADHERE_TO_DEFORMATION] = True
         muscle_dictionary[Tags.STRUCTURE_TYPE] = Tags.HORIZONTAL_LAYER_STRUCTURE